@@ -1,14 +1,24 @@
 import os
 import time
 import json
+import logging
 import re
-from fastapi import FastAPI, BackgroundTasks, HTTPException
+import asyncio
+import io
+import random
+import traceback
+from collections import OrderedDict, deque
+from urllib.parse import urljoin, urlparse
+from fastapi import FastAPI, HTTPException
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 from dotenv import load_dotenv
-from playwright.sync_api import sync_playwright
+from playwright.async_api import async_playwright
 import google.generativeai as genai
-import requests
+from google.api_core.exceptions import ResourceExhausted
+import httpx
+from selectolax.parser import HTMLParser
+import numpy as np
 import pandas as pd
 
 # Load environment variables
@@ -16,8 +26,109 @@ load_dotenv()
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
 MY_SECRET = os.getenv("MY_SECRET")
 
+# Logging: set LOG_LEVEL=DEBUG to see solver diagnostics (CSV samples, HTML).
+# Only this module's logger follows LOG_LEVEL; libraries stay at WARNING.
+logging.basicConfig(level=logging.WARNING)
+log = logging.getLogger(__name__)
+LOG_LEVEL = logging.getLevelName(os.getenv("LOG_LEVEL", "WARNING").upper())
+log.setLevel(LOG_LEVEL if isinstance(LOG_LEVEL, int) else logging.WARNING)
+
 # Configure Gemini
 genai.configure(api_key=GEMINI_API_KEY)
+_GEMINI = genai.GenerativeModel(
+    'models/gemini-2.5-flash',
+    generation_config={"temperature": 0}
+)
+
+# Free-tier limits for gemini-2.5-flash: stay under 10 requests/minute and
+# keep a few calls in flight at most; back off with jitter on 429s
+_GEMINI_SEMAPHORE = asyncio.Semaphore(4)
+_GEMINI_RATE_LOCK = asyncio.Lock()
+_GEMINI_RPM = 10
+_GEMINI_CALLS = deque(maxlen=_GEMINI_RPM)
+
+async def gemini_generate(prompt: str, retries=3):
+    async with _GEMINI_SEMAPHORE:
+        for attempt in range(retries):
+            async with _GEMINI_RATE_LOCK:
+                now = time.monotonic()
+                if len(_GEMINI_CALLS) == _GEMINI_RPM and now - _GEMINI_CALLS[0] < 60:
+                    wait = 60 - (now - _GEMINI_CALLS[0])
+                    print(f"   → Gemini rate limit, waiting {wait:.1f}s")
+                    await asyncio.sleep(wait)
+                _GEMINI_CALLS.append(time.monotonic())
+            
+            try:
+                return await _GEMINI.generate_content_async(prompt)
+            except ResourceExhausted as e:
+                print(f"   ✗ Gemini attempt {attempt+1} rate limited: {e}")
+                if attempt < retries - 1:
+                    await asyncio.sleep(2 ** attempt + random.random())
+                else:
+                    raise
+
+# Precompiled patterns
+_RE_SUBMIT_POST = re.compile(r'POST\s+(?:to\s+)?(?:JSON\s+to\s+)?(https?://[^\s<>"]+/submit[^\s<>"]*)', re.IGNORECASE)
+_RE_SUBMIT = re.compile(r'(https?://[^\s<>"]+/submit)', re.IGNORECASE)
+_RE_URL = re.compile(r'https?://[^\s<>"]+')
+_RE_CSV_ANY = re.compile(
+    r'(?:href=["\']([^"\']+\.csv)["\'])|'  # In href attribute
+    r'(?:\(([^)\s]+\.csv)\))|'  # In markdown links like (url)
+    r'(https?://[^\s<>"\'()]+\.csv)',  # Standard URL
+    re.IGNORECASE
+)
+_RE_SCRAPE = re.compile(r'Scrape\s+(\S+)', re.IGNORECASE)
+_RE_CUTOFF = re.compile(r'[Cc]utoff[:\s]+(\d+)')
+_RE_SECRET_CODE = re.compile(r'[Ss]ecret\s+code\s+is\s+(\d+)')
+_RE_LONG_NUMBER = re.compile(r'\b(\d{5,})\b')
+
+# Shared Chromium, launched lazily on first fetch and never closed per fetch.
+# Each fetch gets its own context (isolated cookies/storage, far cheaper than
+# a browser); the semaphore caps how many pages are open at once.
+_PW = None
+_BROWSER = None
+_BROWSER_LOCK = asyncio.Lock()
+_PAGE_SEMAPHORE = asyncio.Semaphore(3)
+
+async def _get_browser():
+    global _PW, _BROWSER
+    async with _BROWSER_LOCK:
+        if _BROWSER is not None and not _BROWSER.is_connected():
+            # Chromium crashed or was killed; relaunch instead of failing every fetch
+            print(f"   ✗ Browser disconnected, relaunching")
+            _BROWSER = None
+        if _PW is None:
+            _PW = await async_playwright().start()
+        if _BROWSER is None:
+            _BROWSER = await _PW.chromium.launch(headless=True)
+    return _BROWSER
+
+# Shared HTTP client: keeps connections to the quiz hosts alive between requests
+_HTTP = httpx.AsyncClient(
+    http2=True,
+    timeout=60,
+    follow_redirects=True,
+    limits=httpx.Limits(max_keepalive_connections=10)
+)
+
+# Submit URL last resolved for each quiz host, most recent hosts only
+_SUBMIT_URL_CACHE = OrderedDict()
+_SUBMIT_URL_CACHE_SIZE = 32
+
+def _remember_submit_url(host: str, submit_url: str):
+    _SUBMIT_URL_CACHE[host] = submit_url
+    _SUBMIT_URL_CACHE.move_to_end(host)
+    while len(_SUBMIT_URL_CACHE) > _SUBMIT_URL_CACHE_SIZE:
+        _SUBMIT_URL_CACHE.popitem(last=False)
+
+# Recently downloaded CSVs by URL, kept only when the server gives a validator
+_CSV_CACHE = OrderedDict()
+_CSV_CACHE_SIZE = 32
+
+# Pending /solve jobs, drained by a fixed pool of chain workers
+_SOLVE_QUEUE = asyncio.Queue()
+_SOLVE_WORKERS = 3
+_WORKER_TASKS = []
 
 # Initialize FastAPI
 app = FastAPI()
@@ -33,21 +144,49 @@ class QuizRequest(BaseModel):
 def root():
     return {"status": "TDS Project 2 API is running", "message": "Send POST to /solve"}
 
+async def solve_worker():
+    while True:
+        email, secret, url = await _SOLVE_QUEUE.get()
+        try:
+            await solve_quiz_chain(email, secret, url)
+        except Exception as e:
+            print(f"✗ Quiz chain failed: {e}")
+        finally:
+            _SOLVE_QUEUE.task_done()
+
+@app.on_event("startup")
+async def startup():
+    for _ in range(_SOLVE_WORKERS):
+        _WORKER_TASKS.append(asyncio.create_task(solve_worker()))
+
+@app.on_event("shutdown")
+async def shutdown():
+    global _PW, _BROWSER
+    for task in _WORKER_TASKS:
+        task.cancel()
+    await asyncio.gather(*_WORKER_TASKS, return_exceptions=True)
+    _WORKER_TASKS.clear()
+    await _HTTP.aclose()
+    if _BROWSER is not None:
+        await _BROWSER.close()
+        await _PW.stop()
+        _PW = _BROWSER = None
+
 # Main endpoint
 @app.post("/solve")
-async def solve_quiz(request: QuizRequest, background_tasks: BackgroundTasks):
+async def solve_quiz(request: QuizRequest):
     if request.secret != MY_SECRET:
         raise HTTPException(status_code=403, detail="Invalid secret")
     
-    background_tasks.add_task(solve_quiz_chain, request.email, request.secret, request.url)
+    _SOLVE_QUEUE.put_nowait((request.email, request.secret, request.url))
     
     return JSONResponse(
-        status_code=200,
+        status_code=202,
         content={"status": "accepted", "message": "Quiz is being processed"}
     )
 
 # Main loop
-def solve_quiz_chain(email: str, secret: str, start_url: str):
+async def solve_quiz_chain(email: str, secret: str, start_url: str):
     current_url = start_url
     quiz_count = 0
     max_quizzes = 10
@@ -61,7 +200,7 @@ def solve_quiz_chain(email: str, secret: str, start_url: str):
         print(f"\n--- Quiz {quiz_count}: {current_url} ---")
         
         try:
-            result = solve_single_quiz(email, secret, current_url)
+            result = await solve_single_quiz(email, secret, current_url)
             
             if result and isinstance(result, dict):
                 if result.get('correct'):
@@ -89,29 +228,26 @@ def solve_quiz_chain(email: str, secret: str, start_url: str):
     print(f"{'='*60}\n")
 
 # Solve single quiz
-def solve_single_quiz(email: str, secret: str, quiz_url: str):
+async def solve_single_quiz(email: str, secret: str, quiz_url: str):
     print("1. Fetching quiz page...")
-    page_text, page_html = fetch_page_with_playwright(quiz_url)
+    page_text, page_html = await fetch_page_async(quiz_url)
     print(f"   ✓ Extracted {len(page_text)} chars text, {len(page_html)} chars HTML")
     
-    time.sleep(3)
-    
-    print("2. Analyzing with Gemini...")
-    analysis = analyze_quiz_page(page_text)
+    # The question is the head of the page text, so the solver doesn't need
+    # to wait for the submit URL lookup; run both at once
+    question = page_text[:500]
+    print(f"2-3. Analyzing and solving...")
+    print(f"   Question: {question[:100] if question else 'N/A'}...")
+    analysis, answer = await asyncio.gather(
+        analyze_quiz_page(page_text, quiz_url),
+        solve_question(question, page_text, page_html, quiz_url)
+    )
     print(f"   ✓ Analysis complete")
     print(f"   Submit URL: {analysis.get('submit_url')}")
-    question = analysis.get('question', 'N/A')
-    print(f"   Question: {question[:100] if question else 'N/A'}...")
-
-    
-    time.sleep(3)
-    
-    print("3. Solving question...")
-    answer = solve_question(analysis.get('question', ''), page_text, page_html, quiz_url)
     print(f"   ✓ Answer: {answer}")
     
     print("4. Submitting answer...")
-    result = submit_answer(
+    result = await submit_answer(
         submit_url=analysis.get('submit_url'),
         email=email,
         secret=secret,
@@ -123,48 +259,152 @@ def solve_single_quiz(email: str, secret: str, quiz_url: str):
     return result
 
 # Fetch page
-def fetch_page_with_playwright(url: str, retries=3):
+# Stylesheets still load: innerText depends on CSS visibility
+_BLOCKED_RESOURCES = ("image", "font", "media")
+
+async def _block_assets(route):
+    if route.request.resource_type in _BLOCKED_RESOURCES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+async def _fetch_page(url: str, load_assets=False):
+    browser = await _get_browser()
+    async with _PAGE_SEMAPHORE:
+        context = await browser.new_context(user_agent="Mozilla/5.0")
+        try:
+            if not load_assets:
+                # Quiz pages are text; skip images, fonts and media
+                await context.route("**/*", _block_assets)
+            page = await context.new_page()
+            await page.goto(url, wait_until="domcontentloaded", timeout=60000)
+            try:
+                # Quiz content is often injected by script; wait briefly for it
+                await page.wait_for_selector("a[href*='.csv'], code, pre", timeout=3000)
+            except Exception:
+                pass
+            try:
+                # Stylesheets must be applied before innerText can honour CSS visibility
+                await page.wait_for_load_state("load", timeout=5000)
+            except Exception:
+                pass
+            
+            # Rendered text and HTML in a single round trip to the browser
+            visible_text, html_content = await page.evaluate(
+                "() => [document.body ? document.body.innerText : '', "
+                "document.documentElement.outerHTML]"
+            )
+            return (visible_text, html_content)
+        finally:
+            await context.close()
+
+async def fetch_page_async(url: str, retries=3, load_assets=False):
     for attempt in range(retries):
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
-                page.goto(url, wait_until="networkidle", timeout=60000)
-                time.sleep(2)
-                
-                visible_text = page.inner_text('body')
-                html_content = page.content()
-                browser.close()
-                
-                return (visible_text, html_content)
+            return await _fetch_page(url, load_assets)
         except Exception as e:
             print(f"   ✗ Attempt {attempt+1} failed: {e}")
             if attempt < retries - 1:
-                time.sleep(5)
+                await asyncio.sleep(5)
             else:
                 raise
 
+# Scrape page: plain HTTP first, browser only if the code isn't in the static HTML
+async def scrape_page(url: str):
+    try:
+        response = await _HTTP.get(url, timeout=10, headers={"User-Agent": "Mozilla/5.0"})
+        response.raise_for_status()
+        tree = HTMLParser(response.text)
+        tree.strip_tags(['script', 'style'])
+        scraped_text = tree.body.text(separator=' ') if tree.body else ''
+        # Only trust an explicit "secret code is ..." here; a bare long number
+        # could be a timestamp or ID while the real code is rendered by JS
+        if _RE_SECRET_CODE.search(scraped_text):
+            return scraped_text
+        print(f"   → No code in static HTML, rendering with browser")
+    except Exception as e:
+        print(f"   ✗ Static fetch failed: {e}")
+    
+    scraped_text, _ = await fetch_page_async(url)
+    return scraped_text
+
+# Fetch CSV bytes, revalidating cached copies with ETag / Last-Modified
+async def fetch_csv_bytes(csv_url: str) -> bytes:
+    headers = {"Accept-Encoding": "gzip"}
+    cached = _CSV_CACHE.get(csv_url)
+    if cached:
+        if cached["etag"]:
+            headers["If-None-Match"] = cached["etag"]
+        if cached["last_modified"]:
+            headers["If-Modified-Since"] = cached["last_modified"]
+    
+    buf = io.BytesIO()
+    async with _HTTP.stream("GET", csv_url, timeout=30, headers=headers) as response:
+        if cached and response.status_code == 304:
+            print(f"   → CSV unchanged, using cached copy")
+            _CSV_CACHE.move_to_end(csv_url)
+            return cached["data"]
+        response.raise_for_status()
+        async for chunk in response.aiter_bytes():
+            buf.write(chunk)
+    
+    data = buf.getvalue()
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if etag or last_modified:
+        _CSV_CACHE[csv_url] = {"etag": etag, "last_modified": last_modified, "data": data}
+        _CSV_CACHE.move_to_end(csv_url)
+        while len(_CSV_CACHE) > _CSV_CACHE_SIZE:
+            _CSV_CACHE.popitem(last=False)
+    return data
+
+# Load CSV: parse with the Arrow reader off the event loop
+async def load_csv(csv_url: str):
+    data = await fetch_csv_bytes(csv_url)
+    return await asyncio.to_thread(pd.read_csv, io.BytesIO(data), header=None, engine="pyarrow")
+
 # Analyze page
-def analyze_quiz_page(page_text: str) -> dict:
-    """Extract submit URL and question - with fallbacks"""
+async def analyze_quiz_page(page_text: str, quiz_url: str) -> dict:
+    """Extract submit URL and question - regex first, Gemini only as a last resort"""
+    host = urlparse(quiz_url).netloc
     
     # First, try to extract submit URL directly with regex
-    submit_url_match = re.search(r'POST\s+(?:to\s+)?(?:JSON\s+to\s+)?([https://[^\s<>"]+/submit[^\s<>"]*)', page_text, re.IGNORECASE)
+    submit_url_match = _RE_SUBMIT_POST.search(page_text)
     if not submit_url_match:
-        submit_url_match = re.search(r'(https://[^\s<>"]+/submit)', page_text, re.IGNORECASE)
+        submit_url_match = _RE_SUBMIT.search(page_text)
     
     if submit_url_match:
-        submit_url = submit_url_match.group(1)
+        # Drop sentence punctuation the POST pattern may have swallowed
+        submit_url = submit_url_match.group(1).rstrip(".,;:)]'")
+        _remember_submit_url(host, submit_url)
         print(f"   → Extracted submit URL directly: {submit_url}")
         return {
             "submit_url": submit_url,
             "question": page_text[:500]
         }
     
+    # Look for ANY submit URL
+    urls = _RE_URL.findall(page_text)
+    submit_url = next((u for u in urls if 'submit' in u.lower()), None)
+    if submit_url:
+        print(f"   → Found submit URL in page: {submit_url}")
+        return {
+            "submit_url": submit_url,
+            "question": page_text[:500]
+        }
+    
+    # Same host as an earlier quiz: reuse its submit URL
+    if host in _SUBMIT_URL_CACHE:
+        _SUBMIT_URL_CACHE.move_to_end(host)
+        submit_url = _SUBMIT_URL_CACHE[host]
+        print(f"   → Using cached submit URL for {host}: {submit_url}")
+        return {
+            "submit_url": submit_url,
+            "question": page_text[:500]
+        }
+    
     # Fallback: Try Gemini
     try:
-        model = genai.GenerativeModel('models/gemini-2.5-flash')
-        
         prompt = f"""
 Extract the submit URL from this page.
 
@@ -176,12 +416,13 @@ Page:
 Return ONLY the URL, nothing else.
 """
         
-        response = model.generate_content(prompt)
+        response = await gemini_generate(prompt)
         submit_url_text = response.text.strip()
         
         # Extract URL from response
-        url_match = re.search(r'https://[^\s<>"]+', submit_url_text)
+        url_match = _RE_URL.search(submit_url_text)
         if url_match:
+            _remember_submit_url(host, url_match.group(0))
             return {
                 "submit_url": url_match.group(0),
                 "question": page_text[:500]
@@ -189,13 +430,8 @@ Return ONLY the URL, nothing else.
     except Exception as e:
         print(f"   ✗ Gemini failed: {e}")
     
-    # Final fallback: Look for ANY submit URL
-    urls = re.findall(r'https://[^\s<>"]+', page_text)
-    submit_url = next((u for u in urls if 'submit' in u.lower()), None)
-    
-    if not submit_url and urls:
-        # Just use the first URL we find
-        submit_url = urls[0]
+    # Final fallback: Just use the first URL we find
+    submit_url = urls[0] if urls else None
     
     if not submit_url:
         # Hardcode as absolute last resort
@@ -209,67 +445,70 @@ Return ONLY the URL, nothing else.
     }
 
 # MAIN SOLVER
-def solve_question(question: str, page_text: str, page_html: str, base_url: str):
-    model = genai.GenerativeModel('models/gemini-2.5-flash')
+async def solve_question(question: str, page_text: str, page_html: str, base_url: str):
+    # Find CSV URL up front so it can load alongside a scrape. The text is
+    # smaller and usually has the link, so scan it before the HTML
+    csv_url = None
+    for content in (page_text, page_html):
+        csv_match = _RE_CSV_ANY.search(content)
+        if csv_match:
+            break
+    if csv_match:
+        csv_url = next(g for g in csv_match.groups() if g)
+        # Clean up URL
+        csv_url = csv_url.strip('"\'()<>')
+        print(f"   → Found CSV URL with pattern: {csv_url}")
+    
+    if csv_url and not csv_url.startswith('http'):
+        # Make absolute if relative
+        csv_url = urljoin(base_url, csv_url)
+    
+    csv_result = None
     
     # Tool 1: Web Scraping
-    scrape_match = re.search(r'Scrape\s+([^\s]+)', question, re.IGNORECASE)
+    scrape_match = _RE_SCRAPE.search(question)
     if scrape_match:
-        from urllib.parse import urljoin
         scrape_path = scrape_match.group(1)
         scrape_url = urljoin(base_url, scrape_path)
         
         print(f"   → Scraping: {scrape_url}")
-        scraped_text, _ = fetch_page_with_playwright(scrape_url)
-        print(f"   → Scraped content: [{scraped_text}]")
+        if csv_url:
+            scraped_text, csv_result = await asyncio.gather(
+                scrape_page(scrape_url), load_csv(csv_url), return_exceptions=True
+            )
+            if isinstance(scraped_text, Exception):
+                raise scraped_text
+        else:
+            scraped_text = await scrape_page(scrape_url)
+        log.debug("Scraped content: [%s]", scraped_text)
         
         # Extract secret code
-        code_match = re.search(r'[Ss]ecret\s+code\s+is\s+(\d+)', scraped_text)
+        code_match = _RE_SECRET_CODE.search(scraped_text)
         if code_match:
             print(f"   → Found secret code: {code_match.group(1)}")
             return code_match.group(1)
         
-        code_match = re.search(r'\b(\d{5,})\b', scraped_text)
+        code_match = _RE_LONG_NUMBER.search(scraped_text)
         if code_match:
             return code_match.group(1)
         
-        return scraped_text.strip()
+        if not csv_url:
+            return scraped_text.strip()
     
     # Tool 2: CSV Analysis - IMPROVED
-    combined_content = page_text + " " + page_html
-    
-    # Multiple patterns to find CSV URLs
-    csv_patterns = [
-        r'https?://[^\s<>"\'()]+\.csv',  # Standard URL
-        r'href=["\']([^"\']+\.csv)["\']',  # In href attribute
-        r'\(([^\)]+\.csv)\)',  # In markdown links like (url)
-    ]
-    
-    csv_url = None
-    for pattern in csv_patterns:
-        csv_match = re.search(pattern, combined_content, re.IGNORECASE)
-        if csv_match:
-            csv_url = csv_match.group(1) if csv_match.lastindex else csv_match.group(0)
-            # Clean up URL
-            csv_url = csv_url.strip('"\'()<>')
-            print(f"   → Found CSV URL with pattern: {csv_url}")
-            break
-    
     if csv_url:
-        # Make absolute if relative
-        if not csv_url.startswith('http'):
-            from urllib.parse import urljoin
-            csv_url = urljoin(base_url, csv_url)
-        
         print(f"   → Loading CSV: {csv_url}")
         
         try:
-            df = pd.read_csv(csv_url, header=None)
-            print(f"   → Loaded CSV: {len(df)} rows, columns: {df.columns.tolist()}")
-            print(f"   → Sample data:\n{df.head(3)}")
+            df = csv_result if csv_result is not None else await load_csv(csv_url)
+            if isinstance(df, Exception):
+                raise df
+            print(f"   → Loaded CSV: {len(df)} rows")
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("CSV columns: %s\nSample data:\n%s", df.columns.tolist(), df.head(3))
             
             # Extract cutoff
-            cutoff_match = re.search(r'[Cc]utoff[:\s]+(\d+)', combined_content)
+            cutoff_match = _RE_CUTOFF.search(page_text) or _RE_CUTOFF.search(page_html)
             if cutoff_match:
                 cutoff = int(cutoff_match.group(1))
                 print(f"   → Cutoff: {cutoff}")
@@ -281,10 +520,11 @@ def solve_question(question: str, page_text: str, page_html: str, base_url: str)
                     print(f"   → Using column: {numeric_col}")
                     
                     # Filter and sum
-                    filtered = df[df[numeric_col] > cutoff]
-                    result = filtered[numeric_col].sum()
+                    values = df[numeric_col].to_numpy()
+                    mask = values > cutoff
+                    result = np.sum(values, where=mask)
                     
-                    print(f"   → Filtered {len(filtered)} rows where {numeric_col} > {cutoff}")
+                    print(f"   → Filtered {np.count_nonzero(mask)} rows where {numeric_col} > {cutoff}")
                     print(f"   → Sum: {result}")
                     
                     return int(result)
@@ -295,11 +535,10 @@ def solve_question(question: str, page_text: str, page_html: str, base_url: str)
             
         except Exception as e:
             print(f"   ✗ CSV processing failed: {e}")
-            import traceback
             traceback.print_exc()
     else:
         print(f"   ✗ No CSV URL found")
-        print(f"   → HTML sample: {page_html[:500]}")
+        log.debug("HTML sample: %s", page_html[:500])
     
     # Fallback: Gemini
     print(f"   → Using Gemini fallback")
@@ -313,7 +552,7 @@ Answer (just the value):
 """
     
     try:
-        response = model.generate_content(prompt)
+        response = await gemini_generate(prompt)
         answer_text = response.text.strip().replace('`', '').replace('"', '').replace("'", '')
         
         try:
@@ -331,9 +570,7 @@ Answer (just the value):
         return "error"
 
 # Submit
-def submit_answer(submit_url: str, email: str, secret: str, quiz_url: str, answer, retries=3):
-    from urllib.parse import urljoin
-    
+async def submit_answer(submit_url: str, email: str, secret: str, quiz_url: str, answer, retries=3):
     if not submit_url.startswith('http'):
         submit_url = urljoin(quiz_url, submit_url)
         print(f"   Converted to absolute: {submit_url}")
@@ -350,7 +587,7 @@ def submit_answer(submit_url: str, email: str, secret: str, quiz_url: str, answe
     
     for attempt in range(retries):
         try:
-            response = requests.post(submit_url, json=payload, timeout=60)
+            response = await _HTTP.post(submit_url, json=payload)
             
             if response.status_code == 200:
                 return response.json()
@@ -359,6 +596,6 @@ def submit_answer(submit_url: str, email: str, secret: str, quiz_url: str, answe
         except Exception as e:
             print(f"   ✗ Attempt {attempt+1} failed: {e}")
             if attempt < retries - 1:
-                time.sleep(5)
+                await asyncio.sleep(5)
             else:
                 return {"correct": False, "reason": str(e)}